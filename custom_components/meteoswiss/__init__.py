@@ -1,9 +1,11 @@
 """Lifecycle of MeteoSwiss."""
 
+import asyncio
 import datetime
 import logging
+import pprint
 import time
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from async_timeout import timeout
 from hamsclientfork import meteoSwissClient
@@ -12,6 +14,7 @@ from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.core import HomeAssistant as HomeAssistantType
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.issue_registry import IssueSeverity
 from homeassistant.helpers.typing import ConfigType
@@ -36,6 +39,7 @@ from custom_components.meteoswiss.const import (
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = [Platform.SENSOR, Platform.WEATHER]
 MAX_CONTINUOUS_ERROR_TIME = 60 * 60
+SHARED_COORDINATORS = "shared_coordinators"
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> Literal[True]:
@@ -55,17 +59,64 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> Literal[True]:
     return True
 
 
+def entry_forecast_name(entry: ConfigEntry) -> str:
+    """Return the name of the forecast configured by an entry."""
+    for key in (CONF_FORECAST_NAME, CONF_REAL_TIME_NAME, CONF_NAME):
+        if value := entry.data.get(key):
+            return str(value)
+    return ""
+
+
+class LazyPformat:
+    """Pretty-print an object only when a log record is actually emitted."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: object) -> None:
+        self._obj = obj
+
+    def __str__(self) -> str:
+        return pprint.pformat(self._obj)
+
+
+class _SharedCoordinator:
+    """A coordinator shared by the entries that poll the same data."""
+
+    def __init__(
+        self,
+        coordinator: "MeteoSwissDataUpdateCoordinator",
+        first_refresh: "asyncio.Task[bool]",
+    ) -> None:
+        self.coordinator = coordinator
+        self.first_refresh = first_refresh
+        # Number of set up entries using the coordinator.
+        self.users = 0
+
+
+async def _async_first_refresh(coordinator: "MeteoSwissDataUpdateCoordinator") -> bool:
+    await coordinator.async_refresh()
+    return coordinator.last_update_success
+
+
+async def _async_release_coordinator(
+    hass: HomeAssistant, coordinator: "MeteoSwissDataUpdateCoordinator"
+) -> None:
+    """Drop one user of a shared coordinator, shutting it down after the last."""
+    shared = hass.data[DOMAIN].get(SHARED_COORDINATORS, {})
+    for key, handle in list(shared.items()):
+        if handle.coordinator is coordinator:
+            handle.users -= 1
+            if handle.users <= 0:
+                del shared[key]
+                await coordinator.async_shutdown()
+            return
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     _LOGGER.debug("Current configuration: %s", entry.data)
-    name = entry.data.get(
-        CONF_FORECAST_NAME,
-        entry.data.get(
-            CONF_REAL_TIME_NAME,
-            entry.data.get(CONF_NAME, ""),
-        ),
-    )
+    name = entry_forecast_name(entry)
     if not name:
         entry_id = entry.entry_id
         ir.async_create_issue(
@@ -89,28 +140,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         * 60
     )
-    coordinator = MeteoSwissDataUpdateCoordinator(
-        hass,
-        interval,
+    # Entries that poll the same post code and stations share one coordinator,
+    # so the MeteoSwiss data is only fetched once per interval.
+    key = (
         entry.data[CONF_POSTCODE],
-        forecast_name=entry.data.get(CONF_FORECAST_NAME, name),
-        weather_station=entry.data.get(CONF_STATION, None),
-        real_time_weather_station_name=entry.data.get(CONF_REAL_TIME_NAME, None),
-        precipitation_station=entry.data.get(CONF_PRECIPITATION_STATION, None),
-        real_time_precipitation_station_name=entry.data.get(
-            CONF_REAL_TIME_PRECIPITATION_NAME, None
-        ),
+        entry.data.get(CONF_STATION, None),
+        entry.data.get(CONF_PRECIPITATION_STATION, None),
+        interval,
     )
-    await coordinator.async_config_entry_first_refresh()
+    shared: dict[tuple[Any, ...], _SharedCoordinator] = hass.data[DOMAIN].setdefault(
+        SHARED_COORDINATORS, {}
+    )
+    handle = shared.get(key)
+    if handle is None:
+        coordinator = MeteoSwissDataUpdateCoordinator(
+            hass,
+            interval,
+            entry.data[CONF_POSTCODE],
+            forecast_name=name,
+            weather_station=entry.data.get(CONF_STATION, None),
+            real_time_weather_station_name=entry.data.get(CONF_REAL_TIME_NAME, None),
+            precipitation_station=entry.data.get(CONF_PRECIPITATION_STATION, None),
+            real_time_precipitation_station_name=entry.data.get(
+                CONF_REAL_TIME_PRECIPITATION_NAME, None
+            ),
+        )
+        # Registered before the first refresh completes, so entries set up
+        # concurrently with the same key wait on it instead of fetching again.
+        handle = shared[key] = _SharedCoordinator(
+            coordinator,
+            hass.async_create_task(_async_first_refresh(coordinator)),
+        )
+    else:
+        _LOGGER.debug("Reusing coordinator for %s", key)
+    coordinator = handle.coordinator
+    handle.users += 1
+
+    if not await handle.first_refresh:
+        await _async_release_coordinator(hass, coordinator)
+        raise ConfigEntryNotReady(
+            f"Initial data fetch failed: {coordinator.last_exception}"
+        ) from coordinator.last_exception
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(
-        entry,
-        PLATFORMS,
-    )
+    try:
+        await hass.config_entries.async_forward_entry_setups(
+            entry,
+            PLATFORMS,
+        )
+    except Exception:
+        del hass.data[DOMAIN][entry.entry_id]
+        await _async_release_coordinator(hass, coordinator)
+        raise
 
     return True
 
@@ -128,7 +212,9 @@ async def async_unload_entry(hass: HomeAssistantType, entry: ConfigEntry) -> boo
     )
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        coordinator = domain_data.pop(entry.entry_id)
+        await _async_release_coordinator(hass, coordinator)
 
     return unload_ok
 
@@ -136,10 +222,7 @@ async def async_unload_entry(hass: HomeAssistantType, entry: ConfigEntry) -> boo
 class MeteoSwissClientResult(ClientResult):
     station: str
     post_code: str
-    forecast_name: str
-    real_time_name: str
     precipitation_station: str
-    real_time_precipitation_name: str
 
 
 class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResult]):
@@ -199,13 +282,19 @@ class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResu
                 update_interval,
             )
 
+        # Only configured real-time stations take part in error tracking.
+        self._stations_to_check = [
+            (station, name)
+            for station, name in (
+                (weather_station, CONF_REAL_TIME_NAME),
+                (precipitation_station, CONF_REAL_TIME_PRECIPITATION_NAME),
+            )
+            if station
+        ]
+
         self.client = meteoSwissClient(  # type:ignore[no-untyped-call]
-            "%s / %s / %s"
-            % (
-                forecast_name,
-                real_time_weather_station_name,
-                real_time_precipitation_station_name,
-            ),
+            f"{forecast_name} / {real_time_weather_station_name}"
+            f" / {real_time_precipitation_station_name}",
             post_code,
             weather_station if weather_station else "NO STATION",
             precipitation_station if precipitation_station else "NO STATION",
@@ -215,8 +304,14 @@ class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResu
         super().__init__(
             hass,
             _LOGGER,
+            # Shared across entries, so not tied to the lifecycle of the entry
+            # being set up; async_unload_entry shuts it down.
+            config_entry=None,
             name=DOMAIN,
             update_interval=update_interval,
+            # MeteoSwiss refreshes less often than we poll; only notify
+            # entities when the fetched data actually changed.
+            always_update=False,
         )
 
     async def _async_update_data(self) -> MeteoSwissClientResult:
@@ -231,51 +326,46 @@ class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResu
             raise UpdateFailed(exc) from exc
 
         # _LOGGER.debug("Data obtained (%s):\n%s", type(data), pprint.pformat(data))
-        for station, name in (
-            (self.weather_station, CONF_REAL_TIME_NAME),
-            (
-                self.precipitation_station,
-                CONF_REAL_TIME_PRECIPITATION_NAME,
-            ),
-        ):
-            if station:
-                if not data["condition_by_station"].get(station):
-                    # Oh no.  We could not retrieve the URL.
-                    # We try 20 times.  If it does not succeed,
-                    # we will induce a config error.
-                    _LOGGER.warning(
-                        "Station %s (%s) provided us with no real-time data",
-                        station,
-                        name,
+        now = time.time()
+        for station, name in self._stations_to_check:
+            if not data["condition_by_station"].get(station):
+                # Oh no.  We could not retrieve the URL.
+                # We try 20 times.  If it does not succeed,
+                # we will induce a config error.
+                _LOGGER.warning(
+                    "Station %s (%s) provided us with no real-time data",
+                    station,
+                    name,
+                )
+                first_error = self.first_error[name]
+                if first_error is None:
+                    first_error = self.first_error[name] = now
+
+                m = MAX_CONTINUOUS_ERROR_TIME
+                last_error = now - first_error
+                if not self.error_raised[name] and last_error > m:
+                    ir.async_create_issue(
+                        self.hass,
+                        DOMAIN,
+                        f"{station}_{name}_provides_no_data_{DOMAIN}",
+                        is_fixable=False,
+                        is_persistent=False,
+                        severity=IssueSeverity.ERROR,
+                        translation_key="station_no_data",
+                        translation_placeholders={
+                            "station": station,
+                        },
                     )
-                    if self.first_error[name] is None:
-                        self.first_error[name] = time.time()
-
-                    m = MAX_CONTINUOUS_ERROR_TIME
-                    last_error = time.time() - self.first_error[name]
-                    if not self.error_raised and last_error > m:
-                        ir.async_create_issue(
-                            self.hass,
-                            DOMAIN,
-                            f"{station}_{name}_provides_no_data_{DOMAIN}",
-                            is_fixable=False,
-                            is_persistent=False,
-                            severity=IssueSeverity.ERROR,
-                            translation_key="station_no_data",
-                            translation_placeholders={
-                                "station": station,
-                            },
-                        )
-                        self.error_raised[name] = True
-                else:
-                    if self.error_raised[name]:
-                        ir.async_delete_issue(
-                            self.hass,
-                            DOMAIN,
-                            f"{station}_{name}_provides_no_data_{DOMAIN}",
-                        )
-                    self.first_error[name] = None
-                    self.error_raised[name] = False
+                    self.error_raised[name] = True
+            else:
+                if self.error_raised[name]:
+                    ir.async_delete_issue(
+                        self.hass,
+                        DOMAIN,
+                        f"{station}_{name}_provides_no_data_{DOMAIN}",
+                    )
+                self.first_error[name] = None
+                self.error_raised[name] = False
 
         if not data["forecast"]:
             # Oh no.  The forecast is empty.
@@ -283,12 +373,13 @@ class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResu
                 "Post code %s provided us with no forecast",
                 self.post_code,
             )
-            if self.first_error[CONF_POSTCODE] is None:
-                self.first_error[CONF_POSTCODE] = time.time()
+            first_error = self.first_error[CONF_POSTCODE]
+            if first_error is None:
+                first_error = self.first_error[CONF_POSTCODE] = now
 
             m = MAX_CONTINUOUS_ERROR_TIME
-            last_error = time.time() - self.first_error[CONF_POSTCODE]
-            if not self.error_raised and last_error > m:
+            last_error = now - first_error
+            if not self.error_raised[CONF_POSTCODE] and last_error > m:
                 ir.async_create_issue(
                     self.hass,
                     DOMAIN,
@@ -313,12 +404,11 @@ class MeteoSwissDataUpdateCoordinator(DataUpdateCoordinator[MeteoSwissClientResu
             self.error_raised[CONF_POSTCODE] = False
 
         newdata = cast(MeteoSwissClientResult, data)
-        newdata[CONF_POSTCODE] = self.post_code  # type:ignore[literal-required]
-        newdata[CONF_FORECAST_NAME] = self.forecast_name  # type:ignore[literal-required]
-        newdata[CONF_STATION] = self.weather_station  # type:ignore[literal-required]
-        newdata[CONF_REAL_TIME_NAME] = self.real_time_weather_station_name  # type:ignore[literal-required]
-        newdata[CONF_PRECIPITATION_STATION] = self.precipitation_station  # type:ignore[literal-required]
-        newdata[CONF_REAL_TIME_PRECIPITATION_NAME] = (
-            self.real_time_precipitation_station_name
-        )  # type:ignore[literal-required]
+        newdata.update(
+            {  # type:ignore[typeddict-item]
+                CONF_POSTCODE: self.post_code,
+                CONF_STATION: self.weather_station,
+                CONF_PRECIPITATION_STATION: self.precipitation_station,
+            }
+        )
         return newdata
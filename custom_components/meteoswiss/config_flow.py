@@ -1,8 +1,12 @@
 """Config flow to configure the Meteo-Swiss integration."""
 
+import functools
 import logging
+import math
 import re
-from typing import Any
+import sys
+import time
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 from hamsclientfork import StationType, meteoSwissClient
@@ -33,6 +37,191 @@ _LOGGER = logging.getLogger(__name__)
 NO_STATION = "No real-time weather station"
 NO_PRECIPITATION_STATION = "No real-time precipitation station"
 
+_POSTCODE_RE = re.compile(r"^\d{4}$")
+_STATION_RE = re.compile(r"^\w{3}$")
+
+_NO_STATION_LABELS = {
+    StationType.WEATHER: NO_STATION,
+    StationType.PRECIPITATION: NO_PRECIPITATION_STATION,
+}
+
+STATIONS_CACHE_TTL = 24 * 60 * 60
+
+
+class _StationCatalogue(NamedTuple):
+    fetched: float
+    stations: dict[str, Any]
+    # Selection label -> station code, as offered in the form.
+    labels: dict[str, str]
+    # The labels in form order, handed to vol.In as-is.
+    choices: tuple[str, ...]
+    # Station codes and their positions on the unit sphere, index-aligned.
+    codes: list[str]
+    coords: list[tuple[float, float, float]]
+
+
+_STATIONS_CACHE: dict[StationType, _StationCatalogue] = {}
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    return (cos_lat * math.cos(lon_r), cos_lat * math.sin(lon_r), math.sin(lat_r))
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_geodata(lat: float, lon: float) -> dict[str, Any]:
+    """Reverse-geocode a location, remembering recent answers.
+
+    Callers round the coordinates (4 decimals is about 11 m) so that going
+    back and forth in the flow does not query Nominatim again.
+    """
+    client = meteoSwissClient("No display name")
+    return client.getGeoData(lat, lon, USER_AGENT)
+
+
+def _get_all_stations_cached(
+    client: meteoSwissClient, station_type: StationType
+) -> _StationCatalogue:
+    """Return the station catalogue of a type.
+
+    The catalogue rarely changes, so it is kept across config flows for
+    STATIONS_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    cached = _STATIONS_CACHE.get(station_type)
+    if cached is None or now - cached.fetched > STATIONS_CACHE_TTL:
+        # Station codes end up in every label, coordinate list and config
+        # entry, so intern them to share a single copy of each.
+        stations = {
+            sys.intern(key): value
+            for key, value in client.get_all_stations(station_type).items()
+        }
+        all_stations = {_NO_STATION_LABELS[station_type]: ""}
+        all_stations.update(
+            {f"{value['name']} ({key})": key for key, value in stations.items()}
+        )
+        codes = []
+        coords = []
+        unlocated = []
+        for key, value in stations.items():
+            try:
+                coord = _unit_vector(float(value["lat"]), float(value["lon"]))
+            except (KeyError, TypeError, ValueError):
+                unlocated.append(key)
+                continue
+            codes.append(key)
+            coords.append(coord)
+        if unlocated:
+            _LOGGER.debug("Stations without usable coordinates: %s", unlocated)
+        cached = _StationCatalogue(
+            now, stations, all_stations, tuple(all_stations), codes, coords
+        )
+        if stations:
+            _STATIONS_CACHE[station_type] = cached
+    return cached
+
+
+def _closest_station(catalogue: _StationCatalogue, lat: float, lon: float) -> str:
+    """Return the code of the station closest to a location.
+
+    On the unit sphere, the chord distance grows with the great-circle
+    distance, so the closest point is also the closest station.  The scan
+    runs entirely in C through map() and math.dist().
+    """
+    if not catalogue.codes:
+        return ""
+    distance_to = functools.partial(math.dist, _unit_vector(lat, lon))
+    return min(zip(map(distance_to, catalogue.coords), catalogue.codes))[1]
+
+
+def _gather_station_info(
+    client: meteoSwissClient, lat: float, lon: float
+) -> dict[StationType, tuple[str, str, _StationCatalogue]]:
+    """Find the closest and all available stations of every station type.
+
+    Meant to run in the executor, so that the whole lookup costs a single
+    round-trip out of the event loop.
+    """
+    info = {}
+    for station_type in (StationType.WEATHER, StationType.PRECIPITATION):
+        catalogue = _get_all_stations_cached(client, station_type)
+        default_station = _closest_station(catalogue, lat, lon)
+        if default_station in catalogue.stations:
+            default_station_name = catalogue.stations[default_station]["name"]
+        else:
+            default_station_name = ""
+        info[station_type] = (default_station, default_station_name, catalogue)
+    return info
+
+
+@functools.lru_cache(maxsize=16)
+def _location_schema(lat: float, lon: float) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_LAT,
+                default=lat,
+            ): float,
+            vol.Required(
+                CONF_LON,
+                default=lon,
+            ): float,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _forecast_schema(postcode: str, name: str, interval: int) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_POSTCODE,
+                default=postcode,
+            ): str,
+            vol.Required(
+                CONF_FORECAST_NAME,
+                default=name,
+            ): str,
+            vol.Required(
+                CONF_UPDATE_INTERVAL,
+                default=interval,
+            ): int,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _stations_schema(
+    name: str,
+    weather_station: str,
+    weather_choices: tuple[str, ...],
+    precipitation_name: str,
+    precipitation_station: str,
+    precipitation_choices: tuple[str, ...],
+) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_STATION,
+                default=weather_station,
+            ): vol.In(weather_choices),
+            vol.Optional(
+                CONF_REAL_TIME_NAME,
+                default=name,
+            ): str,
+            vol.Required(
+                CONF_PRECIPITATION_STATION,
+                default=precipitation_station,
+            ): vol.In(precipitation_choices),
+            vol.Optional(
+                CONF_REAL_TIME_PRECIPITATION_NAME,
+                default=precipitation_name,
+            ): str,
+        }
+    )
+
 
 class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:ignore
     VERSION = 1
@@ -46,6 +235,16 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
         self._post_code = None
         self._forecast_name = None
         self._update_interval = None
+        self._client = None
+
+    def _get_client(self) -> meteoSwissClient:
+        """Return the client of this flow, creating it on first use.
+
+        The client constructor only assigns fields, so it runs in the event loop.
+        """
+        if self._client is None:
+            self._client = meteoSwissClient("No display name", self._post_code)
+        return self._client
 
     async def async_step_user(self, user_input=None):
         """Handle a flow initiated by the user.
@@ -60,29 +259,15 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
             self._post_code,
         )
 
-        def data_schema(lat, lon):
-            return vol.Schema(
-                {
-                    vol.Required(
-                        CONF_LAT,
-                        default=lat,
-                    ): float,
-                    vol.Required(
-                        CONF_LON,
-                        default=lon,
-                    ): float,
-                }
-            )
-
         errors = {}
         if user_input is not None:
             if user_input[CONF_LAT] > 90 or user_input[CONF_LAT] < -90:
                 errors["lat"] = "latitude_error"
             if user_input[CONF_LON] > 180 or user_input[CONF_LON] < -180:
                 errors["lon"] = "longitude_error"
-            schema = data_schema(user_input[CONF_LAT], user_input[CONF_LON])
+            schema = _location_schema(user_input[CONF_LAT], user_input[CONF_LON])
         else:
-            schema = data_schema(
+            schema = _location_schema(
                 self.hass.config.latitude,
                 self.hass.config.longitude,
             )
@@ -116,33 +301,9 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
             self._post_code,
         )
 
-        def data_schema(postcode, name, interval):
-            return vol.Schema(
-                {
-                    vol.Required(
-                        CONF_POSTCODE,
-                        default=postcode,
-                    ): str,
-                    vol.Required(
-                        CONF_FORECAST_NAME,
-                        default=name,
-                    ): str,
-                    vol.Required(
-                        CONF_UPDATE_INTERVAL,
-                        default=interval,
-                    ): int,
-                }
-            )
-
-        client = await self.hass.async_add_executor_job(
-            meteoSwissClient,
-            "No display name",
-            user_input.get(CONF_POSTCODE) if user_input else None,
-        )
-
         errors = {}
         if user_input is not None:
-            if not re.match(r"^\d{4}$", str(user_input[CONF_POSTCODE])):
+            if not _POSTCODE_RE.match(str(user_input[CONF_POSTCODE])):
                 errors[CONF_POSTCODE] = "invalid_postcode"
             if not str(user_input[CONF_FORECAST_NAME]).strip():
                 errors[CONF_FORECAST_NAME] = "real_time_name_empty"
@@ -150,7 +311,7 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
             if user_input[CONF_UPDATE_INTERVAL] < 1:
                 errors[CONF_UPDATE_INTERVAL] = "update_interval_too_low"
 
-            schema = data_schema(
+            schema = _forecast_schema(
                 user_input[CONF_POSTCODE],
                 user_input[CONF_FORECAST_NAME],
                 user_input[CONF_UPDATE_INTERVAL],
@@ -158,10 +319,9 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
         else:
             try:
                 geodata = await self.hass.async_add_executor_job(
-                    client.getGeoData,
-                    self._lat,
-                    self._lon,
-                    USER_AGENT,
+                    _cached_geodata,
+                    round(self._lat, 4),
+                    round(self._lon, 4),
                 )
                 guessed_postal_code = str(
                     geodata.get("address", {}).get(
@@ -184,7 +344,7 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
                 guessed_postal_code = ""
                 guessed_address = ""
 
-            schema = data_schema(
+            schema = _forecast_schema(
                 guessed_postal_code,
                 guessed_address,
                 DEFAULT_UPDATE_INTERVAL,
@@ -207,52 +367,6 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
         )
         return await self.async_step_user_three()
 
-    async def _get_all_weather_stations_and_closest_one(
-        self, client, lat, lon
-    ) -> tuple[str, str, str]:
-        return await self._get_all_stations_and_closest_one(
-            client, lat, lon, station_type=StationType.WEATHER
-        )
-
-    async def _get_all_precipitation_stations_and_closest_one(
-        self, client, lat, lon
-    ) -> tuple[str, str, str]:
-        return await self._get_all_stations_and_closest_one(
-            client, lat, lon, station_type=StationType.PRECIPITATION
-        )
-
-    async def _get_all_stations_and_closest_one(
-        self, client, lat, lon, station_type
-    ) -> tuple[str, str, str]:
-        default_station = await self.hass.async_add_executor_job(
-            client.get_closest_station,
-            lat,
-            lon,
-            station_type,
-        )
-        if default_station:
-            default_station_name = await self.hass.async_add_executor_job(
-                client.get_station_name, default_station
-            )
-        else:
-            default_station_name = ""
-        stations = await self.hass.async_add_executor_job(
-            client.get_all_stations,
-            station_type,
-        )
-        all_stations = {NO_STATION: ""}
-        all_stations.update(
-            {
-                "%s (%s)"
-                % (
-                    value["name"],
-                    key,
-                ): key
-                for key, value in stations.items()
-            }
-        )
-        return default_station, default_station_name, all_stations
-
     async def async_step_user_three(self, user_input=None):
         """Handle the step of setup."""
         _LOGGER.debug(
@@ -262,60 +376,24 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
             self._post_code,
         )
 
-        def data_schema(
-            name,
-            weather_station,
-            weather_stations,
-            precipitation_name,
-            precipitation_station,
-            precipitation_stations,
-        ):
-            return vol.Schema(
-                {
-                    vol.Required(
-                        CONF_STATION,
-                        default=weather_station,
-                    ): vol.In(list(weather_stations)),
-                    vol.Optional(
-                        CONF_REAL_TIME_NAME,
-                        default=name,
-                    ): str,
-                    vol.Required(
-                        CONF_PRECIPITATION_STATION,
-                        default=precipitation_station,
-                    ): vol.In(list(precipitation_stations)),
-                    vol.Optional(
-                        CONF_REAL_TIME_PRECIPITATION_NAME,
-                        default=precipitation_name,
-                    ): str,
-                }
-            )
-
-        client = await self.hass.async_add_executor_job(
-            meteoSwissClient,
-            "No display name",
-            self._post_code,
+        station_info = await self.hass.async_add_executor_job(
+            _gather_station_info,
+            self._get_client(),
+            self._lat,
+            self._lon,
         )
-
         (
             default_weather_station,
             default_weather_station_name,
-            weather_stations,
-        ) = await self._get_all_weather_stations_and_closest_one(
-            client,
-            self._lat,
-            self._lon,
-        )
-
+            weather_catalogue,
+        ) = station_info[StationType.WEATHER]
         (
             default_precipitation_station,
             default_precipitation_station_name,
-            precipitation_stations,
-        ) = await self._get_all_precipitation_stations_and_closest_one(
-            client,
-            self._lat,
-            self._lon,
-        )
+            precipitation_catalogue,
+        ) = station_info[StationType.PRECIPITATION]
+        weather_stations = weather_catalogue.labels
+        precipitation_stations = precipitation_catalogue.labels
 
         errors = {}
         if user_input is not None:
@@ -327,7 +405,7 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
                 if len(real_time_weather_name) < 1:
                     errors[CONF_REAL_TIME_NAME] = "empty_name"
                 # check if the station name is 3 character
-                if not re.match(r"^\w{3}$", weather_station):
+                if not _STATION_RE.match(weather_station):
                     errors[CONF_STATION] = "invalid_station_name"
             else:
                 weather_station = None
@@ -345,32 +423,31 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
                 if len(real_time_precipitation_name) < 1:
                     errors[CONF_REAL_TIME_PRECIPITATION_NAME] = "empty_name"
                 # check if the station name is 3 character
-                if not re.match(r"^\w{3}$", weather_station):
+                if not _STATION_RE.match(precipitation_station):
                     errors[CONF_PRECIPITATION_STATION] = "invalid_station_name"
             else:
                 precipitation_station = None
                 real_time_precipitation_name = None
 
-            schema = data_schema(
+            schema = _stations_schema(
                 user_input[CONF_REAL_TIME_NAME],
                 user_input[CONF_STATION],
-                weather_stations,
+                weather_catalogue.choices,
                 user_input[CONF_REAL_TIME_PRECIPITATION_NAME],
                 user_input[CONF_PRECIPITATION_STATION],
-                precipitation_stations,
+                precipitation_catalogue.choices,
             )
         else:
             if default_weather_station:
-                default_station_selection = "%s (%s)" % (
-                    default_weather_station_name,
-                    default_weather_station,
+                default_station_selection = (
+                    f"{default_weather_station_name} ({default_weather_station})"
                 )
             else:
-                default_weather_station = NO_PRECIPITATION_STATION
+                default_station_selection = NO_STATION
             if default_precipitation_station:
-                default_precipitation_station_selection = "%s (%s)" % (
-                    default_precipitation_station_name,
-                    default_precipitation_station,
+                default_precipitation_station_selection = (
+                    f"{default_precipitation_station_name}"
+                    f" ({default_precipitation_station})"
                 )
             else:
                 default_precipitation_station_selection = NO_PRECIPITATION_STATION
@@ -379,13 +456,13 @@ class MeteoSwissFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
                 default_precipitation_station_name or ""
             )
 
-            schema = data_schema(
+            schema = _stations_schema(
                 default_weather_station_name,
                 default_station_selection,
-                weather_stations,
+                weather_catalogue.choices,
                 default_precipitation_station_name,
                 default_precipitation_station_selection,
-                precipitation_stations,
+                precipitation_catalogue.choices,
             )
 
         if errors or user_input is None:
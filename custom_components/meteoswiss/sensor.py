@@ -1,5 +1,4 @@
 import logging
-import pprint
 import typing
 from datetime import date, datetime
 from decimal import Decimal
@@ -12,7 +11,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from custom_components.meteoswiss import MeteoSwissDataUpdateCoordinator
+from custom_components.meteoswiss import (
+    LazyPformat,
+    MeteoSwissClientResult,
+    MeteoSwissDataUpdateCoordinator,
+)
 from custom_components.meteoswiss.const import (
     CONF_POSTCODE,
     CONF_PRECIPITATION_STATION,
@@ -20,16 +23,22 @@ from custom_components.meteoswiss.const import (
     CONF_REAL_TIME_PRECIPITATION_NAME,
     CONF_STATION,
     DOMAIN,
-    SENSOR_DATA_ID,
-    SENSOR_TYPE_CLASS,
-    SENSOR_TYPE_ICON,
-    SENSOR_TYPE_NAME,
-    SENSOR_TYPE_UNIT,
-    SENSOR_TYPES,
+    SENSOR_PROFILES,
+    SensorSpec,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator data key of the station and config entry key of its name,
+# per station type.
+_STATION_KEYS = {
+    StationType.WEATHER: (CONF_STATION, CONF_REAL_TIME_NAME),
+    StationType.PRECIPITATION: (
+        CONF_PRECIPITATION_STATION,
+        CONF_REAL_TIME_PRECIPITATION_NAME,
+    ),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,10 +51,10 @@ async def async_setup_entry(
 
     if c.weather_station:
         async_add_entities(
-            [
-                MeteoSwissSensor(entry.entry_id, typ, c, StationType.WEATHER)
-                for typ in SENSOR_TYPES
-            ],
+            (
+                MeteoSwissSensor(entry, typ, spec, c, StationType.WEATHER)
+                for typ, spec in SENSOR_PROFILES
+            ),
             True,
         )
     else:
@@ -55,10 +64,10 @@ async def async_setup_entry(
         )
     if c.precipitation_station:
         async_add_entities(
-            [
-                MeteoSwissSensor(entry.entry_id, typ, c, StationType.PRECIPITATION)
-                for typ in SENSOR_TYPES
-            ],
+            (
+                MeteoSwissSensor(entry, typ, spec, c, StationType.PRECIPITATION)
+                for typ, spec in SENSOR_PROFILES
+            ),
             True,
         )
     else:
@@ -76,87 +85,62 @@ class MeteoSwissSensor(
 
     def __init__(
         self,
-        integration_id: str,
-        sensor_type: typing.Any,
+        entry: ConfigEntry,
+        sensor_type: str,
+        spec: SensorSpec,
         coordinator: MeteoSwissDataUpdateCoordinator,
         station_type: StationType,
     ):
         super().__init__(coordinator)
         self._station_type = station_type
-        self._attr_unique_id = "sensor.%s-%s%s" % (
-            integration_id,
-            sensor_type,
-            "-precipitation" if station_type == StationType.PRECIPITATION else "",
-        )
-        self._state = None
-        self._type = sensor_type
-        self._attr_native_unit_of_measurement = SENSOR_TYPES[self._type][
-            SENSOR_TYPE_UNIT
-        ]
-        self._attr_icon = SENSOR_TYPES[self._type][SENSOR_TYPE_ICON]
-        self._attr_device_class = SENSOR_TYPES[self._type][SENSOR_TYPE_CLASS]
+        suffix = "-precipitation" if station_type == StationType.PRECIPITATION else ""
+        self._attr_unique_id = f"sensor.{entry.entry_id}-{sensor_type}{suffix}"
+        self._spec = spec
+        self._data_id = self._spec.data_id
+        self._attr_native_unit_of_measurement = self._spec.unit
+        self._attr_icon = self._spec.icon
+        self._attr_device_class = self._spec.device_class
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._data = coordinator.data
-        self._attr_station = coordinator.data[
-            CONF_STATION
-            if station_type == StationType.WEATHER
-            else CONF_PRECIPITATION_STATION
-        ]
+        station_key, name_key = _STATION_KEYS[station_type]
+        self._attr_station = coordinator.data[station_key]
         self._attr_post_code = coordinator.data[CONF_POSTCODE]
+        # The coordinator may be shared, so names come from our own entry.
+        station_name = entry.data.get(name_key)
+        self._attr_name = f"{station_name} {self._spec.name}"
+        self._station_row = self._get_station_row()
+        self._last_state: tuple[typing.Any, bool] | None = None
 
     @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        x = SENSOR_TYPES[self._type][SENSOR_TYPE_NAME]
-        name_key = (
-            CONF_REAL_TIME_NAME
-            if self._station_type == StationType.WEATHER
-            else CONF_REAL_TIME_PRECIPITATION_NAME
-        )
-        return f"{self._data[name_key]} {x}"
+    def _data(self) -> MeteoSwissClientResult:
+        return self.coordinator.data
+
+    def _get_station_row(self) -> dict[str, typing.Any] | None:
+        row = self._data.get("condition_by_station", {}).get(self._attr_station)
+        if row is not None and not isinstance(row, dict):
+            _LOGGER.warning(
+                "Real-time weather station returned bad data:\n%s",
+                LazyPformat(row),
+            )
+            return None
+        return row
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
-        dataId = SENSOR_TYPES[self._type][SENSOR_DATA_ID]
-        data: StateType | date | datetime | Decimal = None
-        if (
-            self._attr_station not in self._data["condition_by_station"]
-            or not self._data["condition_by_station"][self._attr_station]
-        ):
-            pass
-        else:
-            try:
-                data = self._data["condition_by_station"][self._attr_station][dataId]
-            except Exception:
-                _LOGGER.warning(
-                    "Real-time weather station returned bad data:\n%s",
-                    pprint.pformat(self._data),
-                )
-                data = None
-        return data
+        row = self._station_row
+        return row.get(self._data_id) if row else None
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        available = False
-        dataId = SENSOR_TYPES[self._type][SENSOR_DATA_ID]
-        if (
-            self._attr_station not in self._data["condition_by_station"]
-            or not self._data["condition_by_station"][self._attr_station]
-        ):
-            pass
-        else:
-            try:
-                available = (
-                    self._data["condition_by_station"][self._attr_station][dataId]
-                    is not None
-                )
-            except Exception:
-                available = False
-        return available
+        row = self._station_row
+        return row is not None and row.get(self._data_id) is not None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-        self._data = self.coordinator.data
+        """Handle data update, writing state only if this reading changed."""
+        self._station_row = self._get_station_row()
+        state = (self.native_value, self.available)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import datetime
+import bisect
 import logging
-import pprint
+from datetime import UTC, datetime
 from typing import Any, cast
 
 from hamsclientfork.client import CurrentCondition, DayForecast, HourlyForecast
@@ -30,12 +30,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.meteoswiss import (
+    LazyPformat,
     MeteoSwissClientResult,
     MeteoSwissDataUpdateCoordinator,
+    entry_forecast_name,
 )
 from custom_components.meteoswiss.const import (
-    CODE_TO_CONDITION_MAP,
-    CONF_FORECAST_NAME,
+    CONDITION_BY_CODE,
     CONF_POSTCODE,
     CONF_PRECIPITATION_STATION,
     CONF_REAL_TIME_NAME,
@@ -54,44 +55,98 @@ async def async_setup_entry(
 ) -> None:
     """Set up weather entity."""
     c: MeteoSwissDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([MeteoSwissWeather(entry.entry_id, c)], True)
+    async_add_entities([MeteoSwissWeather(entry, c)], True)
 
 
-def condition_name_to_first_value(
-    condition: None | list[CurrentCondition], name: str
-) -> float | None:
+def condition_for_icon(icon: Any) -> str | None:
+    """Map a MeteoSwiss icon ID to a Home Assistant condition."""
+    if not isinstance(icon, int):
+        # Accept icon IDs that arrive as numeric strings too.
+        try:
+            icon = int(icon)
+        except (TypeError, ValueError):
+            return None
+    if 0 <= icon < len(CONDITION_BY_CODE):
+        return CONDITION_BY_CODE[icon]
+    return None
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert a real-time reading to float, or None if it is missing."""
+    if value is None or value == "-":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        _LOGGER.warning("Real-time reading %r is not a number", value)
+        return None
+
+
+# Entity attribute set from each real-time measurement, with its MeteoSwiss
+# parameter name.
+_CONDITION_FIELDS = (
+    ("_attr_native_temperature", "tre200s0"),
+    ("_attr_native_pressure", "prestas0"),
+    ("_pressure_qff", "pp0qffs0"),
+    ("_pressure_qnh", "pp0qnhs0"),
+    ("_attr_humidity", "ure200s0"),
+    ("_attr_native_wind_speed", "fu3010z0"),
+    ("_attr_wind_bearing", "dkl010z0"),
+)
+
+
+def _parse_conditions(
+    condition: None | list[CurrentCondition],
+) -> dict[str, float | None]:
+    """Map each _CONDITION_FIELDS attribute to the first station value for it."""
+    values: dict[str, float | None] = dict.fromkeys(
+        attr for attr, _ in _CONDITION_FIELDS
+    )
     if not condition:
         # Real-time weather station provides no data.
         _LOGGER.debug("Current condition is empty for all stations: %s", condition)
-        return None
-    for n, row in enumerate(condition):
-        try:
-            value = row[name]  # type:ignore[literal-required]
-        except Exception:
-            _LOGGER.exception(
-                "Current condition %s (%s) has no value for %s", n, row, name
-            )
-            continue
-        if value is None or value == "-":
-            _LOGGER.debug(
-                "Value %s of current condition %s (%s) is %s, so not available",
-                name,
-                n,
-                row,
-                value,
-            )
-            continue
-        try:
-            return float(value)
-        except Exception:
-            _LOGGER.exception(
-                "Error converting %s to float for condition in row %s (%s)",
-                value,
-                n,
-                row,
-            )
-            continue
-    return None
+        return values
+    missing = list(_CONDITION_FIELDS)
+    for row in condition:
+        still_missing = []
+        for attr, name in missing:
+            value = _to_float(row.get(name))
+            if value is None:
+                still_missing.append((attr, name))
+            else:
+                values[attr] = value
+        missing = still_missing
+        if not missing:
+            break
+    return values
+
+
+def _build_attribution(
+    post_code: str,
+    weather_station: str | None,
+    weather_station_name: str | None,
+    precipitation_station: str | None,
+    precipitation_station_name: str | None,
+) -> str:
+    parts = [
+        "Data provided by MeteoSwiss.",
+        f"Forecasts from postal code {post_code}.",
+    ]
+    if weather_station:
+        parts.append(
+            "Real-time weather data from weather station"
+            f" {weather_station} ({weather_station_name})."
+        )
+    if precipitation_station:
+        parts.append(
+            "Real-time weather data from weather station"
+            f" {precipitation_station} ({precipitation_station_name})."
+        )
+    if weather_station or precipitation_station:
+        parts.append("Stations available at https://rudd-o.com/meteostations .")
+    else:
+        parts.append("No real-time stations used by this weather entry.")
+    return "  ".join(parts)
 
 
 class MeteoSwissWeather(
@@ -108,30 +163,51 @@ class MeteoSwissWeather(
 
     def __init__(
         self,
-        integration_id: str,
+        entry: ConfigEntry,
         coordinator: MeteoSwissDataUpdateCoordinator,
     ):
         super().__init__(coordinator)
-        self._attr_unique_id = "weather.%s" % integration_id
+        self._attr_unique_id = f"weather.{entry.entry_id}"
+        # The coordinator may be shared, so names come from our own entry.
+        self._displayName = entry_forecast_name(entry)
         self._attr_post_code = coordinator.data[CONF_POSTCODE]
         self._attr_station = coordinator.data[CONF_STATION]
         self._attr_weather_station = self._attr_station
-        self._attr_weather_station_name = coordinator.data[CONF_REAL_TIME_NAME]
+        self._attr_weather_station_name = entry.data.get(CONF_REAL_TIME_NAME)
         self._attr_precipitation_station = coordinator.data[CONF_PRECIPITATION_STATION]
-        self._attr_precipitation_station_name = coordinator.data[
+        self._attr_precipitation_station_name = entry.data.get(
             CONF_REAL_TIME_PRECIPITATION_NAME
-        ]
+        )
+        self._attr_attribution = _build_attribution(
+            self._attr_post_code,
+            self._attr_weather_station,
+            self._attr_weather_station_name,
+            self._attr_precipitation_station,
+            self._attr_precipitation_station_name,
+        )
         self.__set_data(coordinator.data)
 
     def __set_data(self, data: MeteoSwissClientResult) -> None:
-        self._displayName = data[CONF_FORECAST_NAME]
         self._forecastData = data["forecast"]
-        self._condition_for_all_stations = data["condition"]
+        self._conditionData = data["condition"]
+        for attr, value in _parse_conditions(data["condition"]).items():
+            setattr(self, attr, value)
+        # These only change with coordinator data, so derive them here once.
+        self._attr_condition = self._current_condition()
+        self._daily_cache = self._build_daily_forecast()
+        # Hourly rows are formatted here but split against the clock on read.
+        self._hourly_cache, self._hourly_times = self._build_hourly_forecast()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
         data = self.coordinator.data
+        if (
+            data["forecast"] is self._forecastData
+            and data["condition"] is self._conditionData
+        ):
+            # Nothing this entity shows has changed, so skip the write.
+            return
         self.__set_data(data)
         self.async_write_ha_state()
 
@@ -139,144 +215,77 @@ class MeteoSwissWeather(
     def name(self) -> Any:
         return self._displayName
 
-    @property
-    def native_temperature(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "tre200s0"
-        )
-
-    @property
-    def native_pressure(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "prestas0"
-        )
-
     @property
     def pressure_qff(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "pp0qffs0"
-        )
+        return self._pressure_qff
 
     @property
     def pressure_qnh(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "pp0qnhs0"
-        )
-
-    @property
-    def humidity(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "ure200s0"
-        )
-
-    @property
-    def native_wind_speed(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "fu3010z0"
-        )
-
-    @property
-    def wind_bearing(self) -> float | None:
-        return condition_name_to_first_value(
-            self._condition_for_all_stations, "dkl010z0"
-        )
+        return self._pressure_qnh
 
     # FIXME add precipitation conditions above.
 
-    @property
-    def condition(self) -> str | None:
-        symbolId = self._forecastData["currentWeather"]["icon"]
-        try:
-            cond: str | None = (
-                str(CODE_TO_CONDITION_MAP.get(symbolId, ("", None))[0]) or None
-            )
-            if cond is None:
-                _LOGGER.error(
-                    "Expected a known int for the forecast icon, not None",
-                    symbolId,
-                )
-                return STATE_UNAVAILABLE
-            _LOGGER.debug(
-                "Current symbol is %s, condition is: %s",
-                symbolId,
-                cond,
-            )
-            return cond
-        except TypeError as exc:
+    def _current_condition(self) -> str | None:
+        current_weather = (self._forecastData or {}).get("currentWeather") or {}
+        symbolId = current_weather.get("icon")
+        if symbolId is None:
+            # Degraded payload: no current weather to derive a condition from.
+            return STATE_UNAVAILABLE
+        cond = condition_for_icon(symbolId)
+        if cond is None:
             _LOGGER.error(
-                "Expected an int, not %r, to decide on the forecast icon: %s",
+                "Expected a known int for the forecast icon, not %r",
                 symbolId,
-                exc,
             )
             _LOGGER.error("Forecast data: %r", self._forecastData)
             return STATE_UNAVAILABLE
+        return cond
 
-    @property
-    def attribution(self) -> str:
-        a = "Data provided by MeteoSwiss."
-        a += "  Forecasts from postal code %s." % (self._attr_post_code,)
-        if self._attr_weather_station:
-            a += "  Real-time weather data from weather station %s (%s)." % (
-                self._attr_weather_station,
-                self._attr_weather_station_name,
-            )
-        if self._attr_precipitation_station:
-            a += "  Real-time weather data from weather station %s (%s)." % (
-                self._attr_precipitation_station,
-                self._attr_precipitation_station_name,
-            )
-        if self._attr_weather_station or self._attr_precipitation_station:
-            url = "https://rudd-o.com/meteostations"
-            a += "  Stations available at %s ." % (url,)
-        else:
-            a += "  No real-time stations used by this weather entry."
-        return a
-
-    def _daily_forecast(self) -> list[Forecast] | None:
+    def _build_daily_forecast(self) -> list[Forecast] | None:
         if not self._forecastData:
             return None
-        fcdata_out: list[Forecast] = []
-        # Skip the first element - it's the forecast for the current day
+        forecast_data = cast(
+            list[DayForecast], self._forecastData.get("regionForecast") or []
+        )
+        if not forecast_data:
+            return []
+        # MeteoSwiss already provides ISO dates, so rows are mapped as-is.
         try:
-            for untyped_forecast in self._forecastData["regionForecast"]:
-                forecast = cast(DayForecast, untyped_forecast)
-                data_out: Forecast = {
+            fcdata_out: list[Forecast] = [
+                {
                     ATTR_FORECAST_TIME: forecast["dayDate"],
                     ATTR_FORECAST_NATIVE_TEMP_LOW: forecast["temperatureMin"],
                     ATTR_FORECAST_NATIVE_TEMP: forecast["temperatureMax"],
-                    ATTR_FORECAST_CONDITION: str(
-                        CODE_TO_CONDITION_MAP.get(forecast["iconDay"], ("", None))[0]
-                    )
-                    or None,
+                    ATTR_FORECAST_CONDITION: condition_for_icon(forecast["iconDay"]),
                     ATTR_FORECAST_NATIVE_PRECIPITATION: forecast["precipitation"],
                 }
-                fcdata_out.append(data_out)
+                for forecast in forecast_data
+            ]
         except Exception as e:
             _LOGGER.exception(
                 "Error while converting daily forecast: %s\nForecast data: %s",
                 e,
-                pprint.pformat(self._forecastData["regionForecast"]),
+                LazyPformat(forecast_data),
             )
             raise
         _LOGGER.debug("Daily forecast has %d items", len(fcdata_out))
         return fcdata_out
 
-    def _hourly_forecast(self) -> list[Forecast] | None:
+    def _build_hourly_forecast(
+        self,
+    ) -> tuple[list[Forecast] | None, list[datetime]]:
+        """Return the formatted hourly rows and their times, index-aligned."""
+        times: list[datetime] = []
         if not self._forecastData:
-            return None
+            return None, times
         fcdata_out: list[Forecast] = []
-        # Skip the first element - it's the forecast for the current day
-        now = datetime.datetime.now(datetime.timezone.utc)
         forecast_data = cast(
-            list[HourlyForecast], self._forecastData["regionHourlyForecast"]
+            list[HourlyForecast], self._forecastData.get("regionHourlyForecast") or []
         )
-        biggers = [f["time"] > now for f in forecast_data]
-        try:
-            idx = biggers.index(True)
-        except IndexError:
-            return fcdata_out
+        if not forecast_data:
+            return fcdata_out, times
         try:
-            for forecast in forecast_data[idx - 1 :]:
+            for forecast in forecast_data:
                 data_out: Forecast = {
                     ATTR_FORECAST_TIME: forecast["time"]
                     .isoformat("T")
@@ -287,25 +296,33 @@ class MeteoSwissWeather(
                     ATTR_FORECAST_NATIVE_PRECIPITATION: forecast["precipitationMax"],
                 }
                 fcdata_out.append(data_out)
+                times.append(forecast["time"])
         except Exception as e:
             _LOGGER.exception(
                 "Error while converting hourly forecast: %s\nForecast data: %s",
                 e,
-                pprint.pformat(self._forecastData["regionDailyForecast"]),
+                LazyPformat(forecast_data),
             )
             raise
         _LOGGER.debug("Hourly forecast has %d items", len(fcdata_out))
-        return fcdata_out
+        return fcdata_out, times
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return bool(self._daily_forecast())
+        return bool(self._daily_cache)
 
     async def async_forecast_daily(self) -> list[Forecast]:
         """Return the daily forecast in native units."""
-        return self._daily_forecast() or []
+        return self._daily_cache or []
 
     async def async_forecast_hourly(self) -> list[Forecast]:
         """Return the hourly forecast in native units."""
-        return self._hourly_forecast() or []
+        if not self._hourly_cache:
+            return []
+        # Rows are sorted by time; start at the one covering the current hour.
+        idx = bisect.bisect_right(self._hourly_times, datetime.now(UTC))
+        if idx == len(self._hourly_times):
+            # Every row is in the past.
+            return []
+        return self._hourly_cache[max(idx - 1, 0) :]